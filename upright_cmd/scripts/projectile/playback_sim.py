@@ -62,7 +62,7 @@ def main():
     Q_obs = np.array([0, 0, 0, 1])
 
     # data logging
-    logger = DataLogger(config)
+    logger = DataLogger(config, duration=sim.duration)
 
     logger.add("sim_timestep", sim.timestep)
     logger.add("duration", sim.duration)
@@ -199,8 +199,7 @@ def main():
             x = np.concatenate((q, v, a, x_obs))
 
             # log sim stuff
-            r_ew_w, Q_we = sim.robot.link_pose()
-            v_ew_w, ω_ew_w = sim.robot.link_velocity()
+            r_ew_w, Q_we, v_ew_w, ω_ew_w = sim.robot.link_pose_and_velocity()
             r_ow_ws, Q_wos = sim.object_poses()
             logger.append("ts", t)
             logger.append("xs", x)
@@ -78,7 +78,7 @@ def main():
     # return
 
     # data logging
-    logger = DataLogger(config)
+    logger = DataLogger(config, duration=env.duration)
 
     logger.add("sim_timestep", env.timestep)
     logger.add("duration", env.duration)
@@ -98,6 +98,17 @@ def main():
     v_cmd = np.zeros_like(v)
     a_est = np.zeros_like(a)
 
+    # the true and noisy states are filled in place each step
+    x = np.zeros_like(x)
+    x_noisy = np.zeros_like(x)
+    iv = env.robot.nq
+    ia = iv + env.robot.nv
+    io = ia + env.robot.nv
+
+    # constant integration coefficients for the command
+    dt = env.timestep
+    half_dt2 = 0.5 * dt**2
+
     T = model.settings.tracking
     Kx = np.hstack(
         (
@@ -107,6 +118,23 @@ def main():
         )
     )
 
+    # settings are fixed for the run, so look them up once rather than going
+    # through the bindings every time we log
+    log_alignment_constraints = (
+        model.settings.inertial_alignment_settings.constraint_enabled
+    )
+    log_alignment_cost = model.settings.inertial_alignment_settings.cost_enabled
+    log_obstacle_constraints = model.settings.obstacle_settings.enabled
+    soft_obstacle_constraints = (
+        model.settings.obstacle_settings.constraint_type
+        == ctrl.bindings.ConstraintType.Soft
+    )
+    use_force_constraints = model.is_using_force_constraints()
+    nx_robot = dims.robot.x
+    nu_robot = dims.robot.u
+    nf = dims.f()
+    frictional_contacts = dims.nf == 3
+
     print("Ready to start.")
     IPython.embed()
 
@@ -118,19 +146,24 @@ def main():
         # roughly perfect
         q, v = env.robot.joint_states(add_noise=False)
         x_obs = env.dynamic_obstacle_state()
-        x = np.concatenate((q, v, a_est, x_obs))
+        x[:iv] = q
+        x[iv:ia] = v
+        x[ia:io] = a_est
+        x[io:] = x_obs
 
         # now get the noisy version for use in the controller
         q_noisy, v_noisy = env.robot.joint_states(add_noise=True)
-        x_noisy = np.concatenate((q_noisy, v_noisy, a_est, x_obs))
+        x_noisy[:iv] = q_noisy
+        x_noisy[iv:ia] = v_noisy
+        x_noisy[ia:] = x[ia:]
 
         # compute policy - MPC is re-optimized automatically when the internal
         # MPC timestep has been exceeded
         try:
             xd, u = ctrl_manager.step(t, x_noisy)
-            xd_robot = xd[: dims.robot.x]
-            u_robot = u[: dims.robot.u]
-            f = u[-dims.f() :]
+            xd_robot = xd[:nx_robot]
+            u_robot = u[:nu_robot]
+            f = u[-nf:]
 
             # check out the gain matrix if desired
             # K = ctrl_manager.mpc.getLinearFeedbackGain(t)
@@ -145,14 +178,15 @@ def main():
             IPython.embed()
             break
 
-        u_cmd = Kx @ (xd - x)[: dims.robot.x] + u_robot
+        u_cmd = Kx @ (xd - x)[:nx_robot] + u_robot
 
         # integrate the command
         # it appears to be desirable to open-loop integrate velocity like this
         # to avoid PyBullet not handling velocity commands accurately at very
         # small values
-        v_cmd = v_cmd + env.timestep * a_est + 0.5 * env.timestep**2 * u_cmd
-        a_est = a_est + env.timestep * u_cmd
+        # this is done in place to avoid allocating new arrays each step
+        v_cmd += dt * a_est + half_dt2 * u_cmd
+        a_est += dt * u_cmd
 
         # generated velocity is in the world frame
         env.robot.command_velocity(v_cmd, bodyframe=False)
@@ -160,8 +194,7 @@ def main():
         # TODO more logger reforms to come
         if logger.ready(t):
             # log sim stuff
-            r_ew_w, Q_we = env.robot.link_pose()
-            v_ew_w, ω_ew_w = env.robot.link_velocity()
+            r_ew_w, Q_we, v_ew_w, ω_ew_w = env.robot.link_pose_and_velocity()
             r_ow_ws, Q_wos = env.object_poses()
             logger.append("ts", t)
             logger.append("us", u_cmd)
@@ -187,7 +220,7 @@ def main():
             logger.append("orn_err", model.angle_between_acc_and_normal())
             logger.append("balancing_constraints", model.balancing_constraints())
 
-            if model.settings.inertial_alignment_settings.constraint_enabled:
+            if log_alignment_constraints:
                 alignment_constraints = (
                     ctrl_manager.mpc.getStateInputInequalityConstraintValue(
                         "inertial_alignment_constraint", t, x, u
@@ -195,17 +228,14 @@ def main():
                 )
                 logger.append("alignment_constraints", alignment_constraints)
 
-            if model.settings.inertial_alignment_settings.cost_enabled:
+            if log_alignment_cost:
                 alignment_constraints = ctrl_manager.mpc.getCostValue(
                     "inertial_alignment_cost", t, x, u
                 )
                 logger.append("alignment_cost", alignment_constraints)
 
-            if model.settings.obstacle_settings.enabled:
-                if (
-                    model.settings.obstacle_settings.constraint_type
-                    == ctrl.bindings.ConstraintType.Soft
-                ):
+            if log_obstacle_constraints:
+                if soft_obstacle_constraints:
                     obs_constraints = (
                         ctrl_manager.mpc.getSoftStateInequalityConstraintValue(
                             "obstacle_avoidance", t, x
@@ -221,7 +251,7 @@ def main():
 
             # TODO eventually it would be nice to also compute this directly
             # via the core library
-            if model.is_using_force_constraints():
+            if use_force_constraints:
                 object_dynamics_constraints = (
                     ctrl_manager.mpc.getStateInputEqualityConstraintValue(
                         "object_dynamics", t, x, u
@@ -232,7 +262,7 @@ def main():
                 # if not frictionless, get the constraint values
                 # if we are frictionless, then the forces just all need to be
                 # non-negative
-                if dims.nf == 3:
+                if frictional_contacts:
                     contact_force_constraints = (
                         ctrl_manager.mpc.getStateInputInequalityConstraintValue(
                             "contact_forces", t, x, u
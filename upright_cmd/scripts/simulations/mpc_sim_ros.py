@@ -75,7 +75,7 @@ def main():
     use_projectile_interface = len(env.dynamic_obstacles) > 0
 
     # data logging
-    logger = DataLogger(config)
+    logger = DataLogger(config, duration=env.duration)
 
     logger.add("sim_timestep", env.timestep)
     logger.add("duration", env.duration)
@@ -127,11 +127,18 @@ def main():
     # wait until a command has been received
     # note that we use real time here since this sim directly controls sim time
     print("Waiting for a command to be received...")
+    next_wall_time = time.monotonic()
     while not ros_interface.ready():
         ros_interface.publish_feedback(t, q, v)
         ros_interface.publish_time(t)
         t += env.timestep
-        time.sleep(env.timestep)
+
+        # only sleep for the remainder of the timestep, so the time spent
+        # publishing does not accumulate as drift
+        next_wall_time += env.timestep
+        remaining = next_wall_time - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
         if rospy.is_shutdown():
             return
 
@@ -141,6 +148,12 @@ def main():
     # add dynamic obstacles and start them moving
     env.launch_dynamic_obstacles(t0=t0)
 
+    # the logged state x is filled in place; the acceleration a is not
+    # measured here, so that part of x just keeps its initial value
+    iv = env.robot.nq
+    ia = iv + env.robot.nv
+    io = ia + env.robot.nv
+
     # simulation loop
     while not rospy.is_shutdown() and t - t0 <= env.duration:
         # feedback is in the world frame
@@ -160,11 +173,12 @@ def main():
         )
 
         if logger.ready(t):
-            x = np.concatenate((q, v, a, x_obs))
+            x[:iv] = q
+            x[iv:ia] = v
+            x[io:] = x_obs
 
             # log sim stuff
-            r_ew_w, Q_we = env.robot.link_pose()
-            v_ew_w, ω_ew_w = env.robot.link_velocity()
+            r_ew_w, Q_we, v_ew_w, ω_ew_w = env.robot.link_pose_and_velocity()
             r_ow_ws, Q_wos = env.object_poses()
             logger.append("ts", t - t0)
             logger.append("xs", x)
@@ -49,7 +49,7 @@ def main():
     interpolator = ctrl.trajectory.TrajectoryInterpolator(mapping, ref)
 
     # data logging
-    logger = DataLogger(config)
+    logger = DataLogger(config, duration=sim.duration)
 
     logger.add("sim_timestep", sim.timestep)
     logger.add("duration", sim.duration)
@@ -73,8 +73,7 @@ def main():
 
         if logger.ready(t):
             # log sim stuff
-            r_ew_w, Q_we = sim.robot.link_pose()
-            v_ew_w, ω_ew_w = sim.robot.link_velocity()
+            r_ew_w, Q_we, v_ew_w, ω_ew_w = sim.robot.link_pose_and_velocity()
             r_ow_ws, Q_wos = sim.object_poses()
             logger.append("ts", t)
             logger.append("xs", x)
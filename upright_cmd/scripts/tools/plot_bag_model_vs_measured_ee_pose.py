@@ -62,7 +62,6 @@ def main():
     r_home, Q_home = robot.link_pose()
 
     # compute modelled EE poses
-    z = np.array([0, 0, 1])
     ee_positions = np.zeros((n, 3))
     ee_orientations = np.zeros((n, 4))
     ee_angles = np.zeros(n)
@@ -71,8 +70,8 @@ def main():
         ee_positions[i, :], ee_orientations[i, :] = robot.link_pose()
         R = core.math.quat_to_rot(ee_orientations[i, :])
 
-        # angle from the upright direction
-        ee_angles[i] = np.arccos(z @ R @ z)
+        # angle from the upright direction: z @ R @ z is just R[2, 2]
+        ee_angles[i] = np.arccos(R[2, 2])
 
     # compute measured tray poses
     tray_positions = np.zeros((n, 3))
@@ -85,7 +84,7 @@ def main():
         orientation = np.array([Q.x, Q.y, Q.z, Q.w])
         tray_orientations[i, :] = orientation
         R = core.math.quat_to_rot(orientation)
-        tray_angles[i] = np.arccos(z @ R @ z)
+        tray_angles[i] = np.arccos(R[2, 2])
 
     # error between measured and modelled orientation
     orientation_errors = np.zeros((n, 4))
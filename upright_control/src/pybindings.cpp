@@ -7,6 +7,7 @@
 #include <ocs2_python_interface/PybindMacros.h>
 #include <ocs2_sqp/MultipleShootingSettings.h>
 #include <pybind11/eigen.h>
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/stl_bind.h>
@@ -21,6 +22,8 @@
 #include <upright_control/dynamics/system_pinocchio_mapping.h>
 #include <upright_control/inertial_alignment.h>
 
+#include <stdexcept>
+
 using namespace upright;
 using namespace ocs2;  // TODO perhaps avoid using
 
@@ -58,6 +61,39 @@ PYBIND11_MODULE(bindings, m) {
     pybind11::bind_map<std::map<std::string, ocs2::scalar_t>>(
         m, "MapStringScalar");
 
+    /* build vector types from numpy arrays in one call, rather than element
+     * by element with push_back */
+    m.def(
+        "scalar_array_from_numpy",
+        [](const ocs2::vector_t &values) {
+            return ocs2::scalar_array_t(values.data(),
+                                        values.data() + values.size());
+        },
+        "values"_a);
+    m.def(
+        "vector_array_from_numpy",
+        [](const pybind11::array_t<ocs2::scalar_t,
+                                   pybind11::array::c_style |
+                                       pybind11::array::forcecast> &rows) {
+            // a 2D array is one vector per row; a non-empty 1D array is a
+            // single vector, while an empty one gives an empty array
+            if (rows.ndim() != 1 && rows.ndim() != 2) {
+                throw std::invalid_argument("Expected a 1D or 2D array.");
+            }
+            const Eigen::Index n =
+                rows.ndim() == 2 ? rows.shape(0) : (rows.size() > 0 ? 1 : 0);
+            const Eigen::Index size = rows.shape(rows.ndim() - 1);
+
+            ocs2::vector_array_t vectors;
+            vectors.reserve(n);
+            for (Eigen::Index i = 0; i < n; ++i) {
+                vectors.emplace_back(Eigen::Map<const ocs2::vector_t>(
+                    rows.data() + i * size, size));
+            }
+            return vectors;
+        },
+        "rows"_a);
+
     pybind11::class_<SystemMapping>(m, "SystemPinocchioMapping")
         .def(pybind11::init<const OptimizationDimensions &>(), "dims")
         .def("get_pinocchio_joint_position",
@@ -1,3 +1,4 @@
+import math
 import time
 
 import numpy as np
@@ -22,31 +23,65 @@ class ControllerModel:
         )
         self.robot, self.geom = build_robot_interfaces(settings)
 
+        # buffers for skew-symmetric matrices in ddC_we_norm
+        self._Sα = np.zeros((3, 3))
+        self._Sω = np.zeros((3, 3))
+
+        # (x, u) at the last call to update
+        self._last_x = None
+        self._last_u = None
+
     @classmethod
     def from_config(cls, config, x0=None):
         settings = ControllerSettings(config=config, x0=x0)
         return cls(settings)
 
     def update(self, x, u=None):
-        """Update model with state x and input u. Required before calling other methods."""
+        """Update model with state x and input u. Required before calling other methods.
+
+        Nothing is recomputed if (x, u) are the same as at the last call.
+        """
+        if self._is_last_update(x, u):
+            return
+        self._last_x = np.array(x)
+        self._last_u = None if u is None else np.array(u)
+
         self.robot.forward_xu(x, u)
 
+        # query the EE kinematics once here rather than separately in each of
+        # the methods below, which are typically all called after each update
+        (
+            _,
+            self._Q_we,
+            _,
+            self._ω_ew_w,
+            self._a_ew_w,
+            self._α_ew_w,
+        ) = self.robot.link_kinematics()
+        self._C_we = core.math.quat_to_rot(self._Q_we)
+
+    def _is_last_update(self, x, u):
+        """Check if (x, u) is the same as at the last call to `update`."""
+        if self._last_x is None or not np.array_equal(x, self._last_x):
+            return False
+        if u is None or self._last_u is None:
+            return u is None and self._last_u is None
+        return np.array_equal(u, self._last_u)
+
     def is_using_force_constraints(self):
         b = self.settings.balancing_settings
         return b.enabled and b.use_force_constraints
 
     def balancing_constraints(self):
-        """Evaluate the balancing constraints at time t and state x."""
-        _, Q_we = self.robot.link_pose()
-        _, ω_ew_w = self.robot.link_velocity()
-        a_ew_w, α_ew_w = self.robot.link_classical_acceleration()
-        C_we = core.math.quat_to_rot(Q_we)
+        """Evaluate the balancing constraints at time t and state x.
 
+        `update` must have been called first.
+        """
         X = core.bindings.RigidBodyState()
-        X.pose.orientation = C_we
-        X.velocity.angular = ω_ew_w
-        X.acceleration.linear = a_ew_w
-        X.acceleration.angular = α_ew_w
+        X.pose.orientation = self._C_we
+        X.velocity.angular = self._ω_ew_w
+        X.acceleration.linear = self._a_ew_w
+        X.acceleration.angular = self._α_ew_w
 
         return self.arrangement.balancing_constraints(X)
 
@@ -59,44 +94,33 @@ class ControllerModel:
 
         `update` must have been called first.
         """
-        _, Q_we = self.robot.link_pose()
-        dists = []
-        for obj in self.objects:
-            dists.append(core.util.support_area_distance(obj, Q_we))
-        return np.array(dists)
+        return core.util.support_area_distances(self.objects, self._Q_we)
 
     def angle_between_acc_and_normal(self):
         """Compute the angle between the total acceleration vector and EE normal vector.
 
         `update` must have been called first.
         """
+        # EE normal vector in the world frame is the last column of C_we
+        z_w = self._C_we[:, 2]
 
-        _, Q_we = self.robot.link_pose()
-        C_we = core.math.quat_to_rot(Q_we)
-        a_ew_w, _ = self.robot.link_classical_acceleration()
-
-        # find EE normal vector in the world frame
-        z_e = np.array([0, 0, 1])
-        z_w = C_we @ z_e
+        # total acceleration (inertial + gravity)
+        total_acc = self._a_ew_w - self.settings.gravity
 
-        # compute direction (unit vector) of total acceleration (inertial + gravity)
-        total_acc = a_ew_w - self.settings.gravity
-        total_acc_direction = total_acc / np.linalg.norm(total_acc)
-
-        # compute the angle between the two
-        angle = np.arccos(z_w @ total_acc_direction)
+        # compute the angle between the two, normalizing the scalar dot product
+        # rather than the acceleration vector; clip to guard against round-off
+        cos_angle = (z_w @ total_acc) / math.sqrt(total_acc @ total_acc)
+        angle = math.acos(min(1.0, max(-1.0, cos_angle)))
         return angle
 
     def ddC_we_norm(self):
-        """Compute the norm of the ddC_we matrix."""
-        _, Q_we = self.robot.link_pose()
-        C_we = core.math.quat_to_rot(Q_we)
-        _, ω_ew_w = self.robot.link_velocity()
-        _, α_ew_w = self.robot.link_classical_acceleration()
-
-        Sα = core.math.skew3(α_ew_w)
-        Sω = core.math.skew3(ω_ew_w)
-        ddC_we = (Sα + Sω @ Sω) @ C_we
+        """Compute the norm of the ddC_we matrix.
+
+        `update` must have been called first.
+        """
+        Sα = core.math.skew3(self._α_ew_w, out=self._Sα)
+        Sω = core.math.skew3(self._ω_ew_w, out=self._Sω)
+        ddC_we = (Sα + Sω @ Sω) @ self._C_we
         return np.linalg.norm(ddC_we, ord=2)
 
 
@@ -197,17 +221,17 @@ class ControllerManager:
 
         Returns: the plan (a full state-input trajectory)
         """
-        ts = []
-        xs = []
-        us = []
+        n = int(np.floor(duration / timestep)) + 1
+        ts = timestep * np.arange(n)
+        xs = np.zeros((n, self.model.settings.dims.x()))
+        us = np.zeros((n, self.model.settings.dims.u()))
 
-        t = 0.0
         x = self.model.settings.initial_state
-        while t <= duration:
+        for i, t in enumerate(ts):
             x, u = self.step(t, x)
-            ts.append(t)
-            xs.append(x.copy())
-            us.append(u.copy())
-            t += timestep
+
+            # step returns internal buffers, so copy into the preallocated rows
+            xs[i, :] = x
+            us[i, :] = u
 
         return StateInputTrajectory(ts, xs, us)
@@ -235,6 +235,18 @@ class UprightRobotKinematics(RobotKinematics):
 
         self.forward(q, v, a)
 
+    def link_kinematics(self):
+        """Get the pose, velocity, and classical acceleration of the tool link.
+
+        forward_xu(...) should be called first.
+
+        Returns a tuple (r, Q, v, ω, a, α).
+        """
+        r, Q = self.link_pose()
+        v, ω = self.link_velocity()
+        a, α = self.link_classical_acceleration()
+        return r, Q, v, ω, a, α
+
     def forward_derivatives_xu(self, x, u=None):
         # get values in Pinocchio coordinates
         q = self.mapping.get_pinocchio_joint_position(x)
@@ -1,5 +1,4 @@
 import numpy as np
-from scipy.linalg import expm
 
 import IPython
 
@@ -8,19 +7,23 @@ class DoubleIntegrator:
     def __init__(self, n):
         self.n = n
 
-        Z = np.zeros((n, n))
-        I = np.eye(n)
-        A = np.block([[Z, I], [Z, Z]])
-        B = np.vstack((Z, I))
+    def _discretize(self, dt):
+        """Discretize the system exactly with timestep dt.
 
-        self.M = np.block([[A, B], [np.zeros((n, 2 * n)), Z]])
+        The augmented system matrix [[A, B], [0, 0]] is nilpotent, so its
+        exponential is exactly I + dt * M + dt^2 * M^2 / 2 and (Ad, Bd) can be
+        written down directly.
+        """
+        Z = np.zeros((self.n, self.n))
+        I = np.eye(self.n)
+        Ad = np.block([[I, dt * I], [Z, I]])
+        Bd = np.vstack((0.5 * dt**2 * I, dt * I))
+        return Ad, Bd
 
     def integrate(self, v, a, u, dt):
         # TODO for some reason this causes non-smooth behaviour
         x = np.concatenate((v, a))
-        Md = expm(dt * self.M)
-        Ad = Md[: 2 * self.n, : 2 * self.n]
-        Bd = Md[: 2 * self.n, 2 * self.n :]
+        Ad, Bd = self._discretize(dt)
         x_new = Ad @ x + Bd @ u
 
         v = x_new[: self.n]
@@ -51,8 +54,14 @@ class StateInputTrajectory:
             us = data["us"]
         return cls(ts=ts, xs=xs, us=us)
 
-    def save(self, filename):
-        np.savez_compressed(filename, ts=self.ts, xs=self.xs, us=self.us)
+    def save(self, filename, compress=True):
+        """Save the trajectory to an npz file.
+
+        Compression can be disabled with `compress=False`, which is much faster
+        for large trajectories at the cost of a larger file.
+        """
+        savez = np.savez_compressed if compress else np.savez
+        savez(filename, ts=self.ts, xs=self.xs, us=self.us)
 
     def __getitem__(self, idx):
         return self.ts[idx], self.xs[idx], self.us[idx]
@@ -149,6 +158,27 @@ class TrajectoryInterpolator:
     def update(self, trajectory):
         self.trajectory = trajectory
 
+        # interpolator for the trajectory segment used most recently, which is
+        # reused for as long as we stay between the same two waypoints
+        self._segment_idx = None
+        self._segment_interpolator = None
+
+    def _segment_interpolator_at(self, i):
+        """Get the interpolator between waypoints i and i + 1."""
+        if i != self._segment_idx:
+            t1, x1, u1 = self.trajectory[i]
+            t2, x2, u2 = self.trajectory[i + 1]
+
+            q1, v1, a1 = self.mapping.xu2qva(x1, u1)
+            p1 = QuinticPoint(t=t1, q=q1, v=v1, a=a1)
+
+            q2, v2, a2 = self.mapping.xu2qva(x2, u2)
+            p2 = QuinticPoint(t=t2, q=q2, v=v2, a=a2)
+
+            self._segment_idx = i
+            self._segment_interpolator = QuinticInterpolator(p1, p2)
+        return self._segment_interpolator
+
     def interpolate(self, t):
         # make sure we are in the correct time range
         # if t < self.trajectory.ts[self.traj_idx]:
@@ -166,30 +196,19 @@ class TrajectoryInterpolator:
             _, x, u = self.trajectory[0]
             return x
 
-        # find the new point in the trajectory
-        for i in range(len(self.trajectory) - 1):
-            if self.trajectory.ts[i] <= t <= self.trajectory.ts[i + 1]:
-                break
-
-        # TODO we could only update the interpolator if we are between new
-        # waypoints, but this is more complex
+        # find the new point in the trajectory: the first i such that
+        # ts[i] <= t <= ts[i + 1]
+        i = np.searchsorted(self.trajectory.ts, t) - 1
 
-        t1, x1, u1 = self.trajectory[i]
-        t2, x2, u2 = self.trajectory[i + 1]
+        t1 = self.trajectory.ts[i]
+        t2, x2, _ = self.trajectory[i + 1]
 
         # if the timestep is small, just steer toward the end waypoint
         if t2 - t1 <= 1e-3:
             return x2
 
-        # if we need to do interpolation, and we're between two new waypoints
-        # in the trajectory, then update the interpolator
-        q1, v1, a1 = self.mapping.xu2qva(x1, u1)
-        p1 = QuinticPoint(t=t1, q=q1, v=v1, a=a1)
-
-        q2, v2, a2 = self.mapping.xu2qva(x2, u2)
-        p2 = QuinticPoint(t=t2, q=q2, v=v2, a=a2)
-
-        # do interpolation
-        qd, vd, ad = QuinticInterpolator(p1, p2).interpolate(t)
+        # do interpolation, only building a new interpolator if we are between
+        # new waypoints in the trajectory
+        qd, vd, ad = self._segment_interpolator_at(i).interpolate(t)
         xd = self.mapping.qva2xu(qd, vd, ad)[0]
         return xd
@@ -14,13 +14,9 @@ class TargetTrajectories(bindings.TargetTrajectories):
     """Wrapper around TargetTrajectories binding."""
 
     def __init__(self, ts, xs, us):
-        ts_ocs2 = bindings.scalar_array()
-        xs_ocs2 = bindings.vector_array()
-        us_ocs2 = bindings.vector_array()
-        for t, x, u in zip(ts, xs, us):
-            ts_ocs2.push_back(t)
-            xs_ocs2.push_back(x)
-            us_ocs2.push_back(u)
+        ts_ocs2 = bindings.scalar_array_from_numpy(np.array(ts, dtype=float))
+        xs_ocs2 = bindings.vector_array_from_numpy(np.array(xs, dtype=float))
+        us_ocs2 = bindings.vector_array_from_numpy(np.array(us, dtype=float))
         super().__init__(ts_ocs2, xs_ocs2, us_ocs2)
 
     @classmethod
@@ -294,10 +290,15 @@ class ControllerSettings(bindings.ControllerSettings):
         if config["operating_points"]["enabled"]:
             operating_path = core.parsing.parse_ros_path(config["operating_points"])
             operating_trajectory = StateInputTrajectory.load(operating_path)
-            for i in range(len(operating_trajectory)):
-                self.operating_times.push_back(operating_trajectory.ts[i])
-                self.operating_states.push_back(operating_trajectory.xs[i, :])
-                self.operating_inputs.push_back(operating_trajectory.us[i, :])
+            self.operating_times = bindings.scalar_array_from_numpy(
+                operating_trajectory.ts
+            )
+            self.operating_states = bindings.vector_array_from_numpy(
+                operating_trajectory.xs
+            )
+            self.operating_inputs = bindings.vector_array_from_numpy(
+                operating_trajectory.us
+            )
 
         # tray balance settings
         self.balancing_settings.enabled = config["balancing"]["enabled"]
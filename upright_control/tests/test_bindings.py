@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from upright_control import bindings
+
+
+def test_scalar_array_from_numpy():
+    ts = np.linspace(0, 1, 5)
+    assert np.array_equal(np.array(bindings.scalar_array_from_numpy(ts)), ts)
+
+
+def test_vector_array_from_numpy():
+    xs = np.arange(12, dtype=float).reshape((4, 3))
+    assert np.array_equal(np.array(bindings.vector_array_from_numpy(xs)), xs)
+
+    # memory layout of the input should not matter
+    xs_f = np.asfortranarray(xs)
+    assert np.array_equal(np.array(bindings.vector_array_from_numpy(xs_f)), xs)
+
+    # a single row, either as a 2D or 1D array
+    x = xs[:1, :]
+    assert np.array_equal(np.array(bindings.vector_array_from_numpy(x)), x)
+    assert np.array_equal(np.array(bindings.vector_array_from_numpy(x[0])), x)
+
+    # empty input gives an empty array, as for TargetTrajectories([], [], [])
+    empty = np.array([], dtype=float)
+    assert len(bindings.vector_array_from_numpy(empty)) == 0
+    assert len(bindings.vector_array_from_numpy(np.zeros((0, 3)))) == 0
+
+    with pytest.raises(ValueError):
+        bindings.vector_array_from_numpy(np.zeros((2, 2, 2)))
@@ -10,15 +10,45 @@ import IPython
 
 
 class DataLogger:
-    """Log data for later saving and viewing."""
+    """Log data for later saving and viewing.
 
-    def __init__(self, config):
+    Appended values are written into preallocated arrays, which grow
+    geometrically as needed. If the number of samples under each key is known
+    ahead of time, passing it as `capacity` avoids any regrowth. Alternatively,
+    passing the `duration` of the run sizes the arrays for one sample per
+    logging timestep.
+    """
+
+    def __init__(self, config, duration=None, capacity=128):
         self.directory = Path(config["logging"]["log_dir"])
         self.timestep = config["logging"]["timestep"]
-        self.last_log_time = -np.infty
+        self.last_log_time = -np.inf
+
+        if duration is not None:
+            capacity = int(np.ceil(duration / self.timestep)) + 1
+        self.capacity = capacity
 
         self.config = config
-        self.data = {}
+
+        # values added with `add`
+        self._values = {}
+
+        # buffers for values added with `append`, along with the number of
+        # values in each
+        self._buffers = {}
+        self._counts = {}
+
+    @property
+    def data(self):
+        """Dict of all logged data.
+
+        Appended values are given as arrays with the first dimension
+        corresponding to the sample index.
+        """
+        data = dict(self._values)
+        for key, buf in self._buffers.items():
+            data[key] = buf[: self._counts[key]]
+        return data
 
     # TODO it may bite me that this is stateful
     def ready(self, t):
@@ -29,24 +59,38 @@ class DataLogger:
 
     def add(self, key, value):
         """Add a single value named `key`."""
-        if key in self.data:
+        if key in self._values or key in self._buffers:
             raise ValueError(f"Key {key} already in the data log.")
-        self.data[key] = value
+        self._values[key] = value
 
     def append(self, key, value):
-        """Append a values to the list named `key`."""
-        # copy to an array (also copies if value is already an array, which is
-        # what we want)
-        a = np.array(value)
-
-        # append to list or start a new list if this is the first value under
-        # `key`
-        if key in self.data:
-            if a.shape != self.data[key][-1].shape:
-                raise ValueError("Data must all be the same shape.")
-            self.data[key].append(a)
-        else:
-            self.data[key] = [a]
+        """Append a value to the array named `key`."""
+        a = np.asarray(value)
+
+        # start a new buffer if this is the first value under `key`
+        if key not in self._buffers:
+            if key in self._values:
+                raise ValueError(f"Key {key} already in the data log.")
+            self._buffers[key] = np.empty((self.capacity,) + a.shape, dtype=a.dtype)
+            self._counts[key] = 0
+
+        buf = self._buffers[key]
+        n = self._counts[key]
+        if a.shape != buf.shape[1:]:
+            raise ValueError("Data must all be the same shape.")
+
+        # grow the buffer if it is full or cannot represent the new value's
+        # type (e.g. a float appended after ints)
+        dtype = np.result_type(buf.dtype, a.dtype)
+        if n == buf.shape[0] or dtype != buf.dtype:
+            size = max(2 * n, 1) if n == buf.shape[0] else buf.shape[0]
+            new_buf = np.empty((size,) + a.shape, dtype=dtype)
+            new_buf[:n] = buf[:n]
+            buf = self._buffers[key] = new_buf
+
+        # assignment copies the value into the buffer
+        buf[n] = a
+        self._counts[key] = n + 1
 
     def save(self, timestamp, name=None):
         """Save the data and configuration to a timestamped directory."""
@@ -148,12 +192,10 @@ class DataPlotter:
         Q_wes = self.data["Q_wes"]
         obj_name = self.data["object_names"][obj_index]
 
-        # object position error
-        r_oe_es = np.zeros_like(r_ow_ws)
-        for i in range(r_oe_es.shape[0]):
-            C_ew = core.math.quat_to_rot(core.math.quat_inverse(Q_wes[i, :]))
-            r_oe_w = r_ow_ws[i, :] - r_ew_ws[i, :]
-            r_oe_es[i, :] = C_ew.dot(r_oe_w)
+        # object position error (computed for all samples at once)
+        C_ews = core.math.quat_to_rot(core.math.quat_inverse(Q_wes))
+        r_oe_ws = r_ow_ws - r_ew_ws
+        r_oe_es = np.einsum("nij,nj->ni", C_ews, r_oe_ws)
         r_oe_e_err = r_oe_es - r_oe_es[0, :]
 
         plt.figure()
@@ -165,16 +207,18 @@ class DataPlotter:
         # object orientation error
         Q_ow0 = core.math.quat_inverse(Q_wos[0, :])
         Q_oe0 = core.math.quat_multiply(Q_ow0, Q_wes[0, :])
-        Q_eo_err = np.zeros_like(Q_wos)
-        angles = np.zeros(Q_wos.shape[0])
-        for i in range(Q_eo_err.shape[0]):
-            try:
-                Q_ew = core.math.quat_inverse(Q_wes[i, :])
-                Q_eo = core.math.quat_multiply(Q_ew, Q_wos[i, :])
-                Q_eo_err[i, :] = core.math.quat_multiply(Q_oe0, Q_eo)
-                angles[i] = core.math.quat_angle(Q_eo_err[i, :])
-            except ValueError as e:
-                IPython.embed()
+        Q_ews = core.math.quat_inverse(Q_wes)
+        Q_eos = core.math.quat_multiply(Q_ews, Q_wos)
+        Q_eo_err = core.math.quat_multiply(Q_oe0, Q_eos)
+
+        # q and -q are the same rotation and PyBullet may return either, so use
+        # a non-negative scalar part for consistent plots and angles
+        Q_eo_err = np.where(Q_eo_err[:, 3:] < 0, -Q_eo_err, Q_eo_err)
+
+        # angle part of the axis-angle of each error quaternion
+        angles = 2 * np.arctan2(
+            np.linalg.norm(Q_eo_err[:, :3], axis=1), Q_eo_err[:, 3]
+        )
 
         plt.plot(ts, Q_eo_err[:, 0], label="$Q_x$")
         plt.plot(ts, Q_eo_err[:, 1], label="$Q_y$")
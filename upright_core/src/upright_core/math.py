@@ -1,6 +1,8 @@
+import math
+
 import numpy as np
 from scipy.linalg import null_space
-from spatialmath.base import q2r, r2q, qunit, rotx, roty, rotz
+from spatialmath.base import r2q, rotx, roty, rotz
 
 
 QUAT_ORDER = "xyzs"
@@ -14,10 +16,24 @@ def unit(x, tol=1e-8):
     return x / d
 
 
-def skew3(v):
-    """Form a skew-symmetric matrix out of 3-dimensional vector v."""
+def skew3(v, out=None):
+    """Form a skew-symmetric matrix out of 3-dimensional vector v.
+
+    If `out` is provided, the matrix is written into it and returned rather
+    than allocating a new one.
+    """
     x, y, z = v
-    return np.array([[0, -z, y], [z, 0, -x], [-y, x, 0]])
+    S = np.empty((3, 3)) if out is None else out
+    S[0, 0] = 0
+    S[0, 1] = -z
+    S[0, 2] = y
+    S[1, 0] = z
+    S[1, 1] = 0
+    S[1, 2] = -x
+    S[2, 0] = -y
+    S[2, 1] = x
+    S[2, 2] = 0
+    return S
 
 
 def equilateral_triangle_inscribed_radius(side_length):
@@ -58,8 +74,29 @@ def equilateral_triangle_r_tau(side_length):
 
 
 def quat_to_rot(q):
-    """Convert quaternion q to rotation matrix."""
-    return q2r(q, order=QUAT_ORDER)
+    """Convert quaternion q to rotation matrix.
+
+    q may also be an array of quaternions with shape (..., 4), in which case
+    an array of rotation matrices with shape (..., 3, 3) is returned.
+    """
+    q = np.asarray(q)
+    x, y, z, w = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+
+    C = np.empty(q.shape[:-1] + (3, 3))
+    C[..., 0, 0] = 1 - 2 * (yy + zz)
+    C[..., 0, 1] = 2 * (xy - wz)
+    C[..., 0, 2] = 2 * (xz + wy)
+    C[..., 1, 0] = 2 * (xy + wz)
+    C[..., 1, 1] = 1 - 2 * (xx + zz)
+    C[..., 1, 2] = 2 * (yz - wx)
+    C[..., 2, 0] = 2 * (xz - wy)
+    C[..., 2, 1] = 2 * (yz + wx)
+    C[..., 2, 2] = 1 - 2 * (xx + yy)
+    return C
 
 
 def rot_to_quat(C):
@@ -67,40 +104,85 @@ def rot_to_quat(C):
     return r2q(C, order=QUAT_ORDER)
 
 
+def quat_normalize(q, tol=1e-8):
+    """Normalize quaternion q to unit magnitude.
+
+    q may also be an array of quaternions with shape (..., 4), which are all
+    normalized at once.
+
+    Raises a ValueError if any quaternion has (near) zero magnitude.
+    """
+    q = np.asarray(q, dtype=float)
+    d = np.linalg.norm(q, axis=-1, keepdims=True)
+    if np.any(d < tol):
+        raise ValueError("Zero quaternion cannot be normalized.")
+    return q / d
+
+
 def quat_multiply(q0, q1, normalize=True):
-    """Hamilton product of two quaternions."""
+    """Hamilton product of two quaternions.
+
+    Either quaternion may also be an array of quaternions with shape (..., 4),
+    in which case the products are broadcast over the leading dimensions.
+    """
     if normalize:
-        q0 = qunit(q0)
-        q1 = qunit(q1)
-    C0 = quat_to_rot(q0)
-    C1 = quat_to_rot(q1)
-    return rot_to_quat(C0 @ C1)
+        q0 = quat_normalize(q0)
+        q1 = quat_normalize(q1)
+    q0 = np.asarray(q0)
+    q1 = np.asarray(q1)
+    x0, y0, z0, w0 = q0[..., 0], q0[..., 1], q0[..., 2], q0[..., 3]
+    x1, y1, z1, w1 = q1[..., 0], q1[..., 1], q1[..., 2], q1[..., 3]
+    return np.stack(
+        [
+            w0 * x1 + x0 * w1 + y0 * z1 - z0 * y1,
+            w0 * y1 - x0 * z1 + y0 * w1 + z0 * x1,
+            w0 * z1 + x0 * y1 - y0 * x1 + z0 * w1,
+            w0 * w1 - x0 * x1 - y0 * y1 - z0 * z1,
+        ],
+        axis=-1,
+    )
 
 
 def quat_rotate(q, r):
-    """Rotate point r by rotation represented by quaternion q."""
-    return quat_to_rot(q) @ r
+    """Rotate point r by rotation represented by unit quaternion q.
+
+    r may also be an array of points with shape (n, 3), in which case each
+    point is rotated.
+    """
+    # rotate directly using the quaternion components rather than building the
+    # rotation matrix
+    v = q[:3]
+    w = q[3]
+    t = 2 * np.cross(v, r)
+    return r + w * t + np.cross(v, t)
 
 
 def quat_transform(r_ba_a, q_ab, r_cb_b):
-    """Transform point r_cb_b by rotating by q_ab and translating by r_ba_a."""
+    """Transform point r_cb_b by rotating by q_ab and translating by r_ba_a.
+
+    r_cb_b may also be an array of points with shape (n, 3).
+    """
     return quat_rotate(q_ab, r_cb_b) + r_ba_a
 
 
 def quat_angle(q):
     """Get the scalar angle represented by a quaternion."""
-    xyz = q[:3]
-    w = q[3]
-    # this is just the angle part of an axis-angle
-    return 2 * np.arctan2(np.linalg.norm(xyz), w)
+    x, y, z, w = q
+    # this is just the angle part of an axis-angle; scalar math is much faster
+    # than np.linalg.norm for a single 3-vector
+    return 2 * math.atan2(math.sqrt(x * x + y * y + z * z), w)
 
 
 def quat_inverse(q):
     """Inverse of quaternion q.
 
     Such that quat_multiply(q, quat_inverse(q)) = [0, 0, 0, 1].
+
+    q may also be an array of quaternions with shape (..., 4).
     """
-    return np.append(-q[:3], q[3])
+    q_inv = np.array(q)
+    q_inv[..., :3] *= -1
+    return q_inv
 
 
 def cylinder_inertia_matrix(mass, radius, height):
@@ -124,7 +206,8 @@ def wedge_inertia_matrix(mass, side_lengths):
     """Compute inertia matrix of a wedge."""
     hx, hy, hz = 0.5 * np.array(side_lengths)
 
-    # computed using sympy script right_triangular_prism_inertia.py
+    # computed offline using the sympy script
+    # upright_cmd/scripts/tools/compute_wedge_inertia.py
     # fmt: off
     J = np.array([
         [hy**2/3 + 2*hz**2/9,                     0,             hx*hz/9],
@@ -19,17 +19,25 @@ from upright_core import math, polyhedron
 import IPython
 
 
+# use the much faster libyaml-based loader if available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 # This is from <https://github.com/Maples7/dict-recursive-update/blob/07204cdab891ac4123b19fe3fa148c3dd1c93992/dict_recursive_update/__init__.py>
 def recursive_dict_update(default, custom):
     """Return a dict merged from default and custom"""
     if not isinstance(default, dict) or not isinstance(custom, dict):
         raise TypeError("Params of recursive_update should be dicts")
 
-    for key in custom:
-        if isinstance(custom[key], dict) and isinstance(default.get(key), dict):
-            default[key] = recursive_dict_update(default[key], custom[key])
-        else:
-            default[key] = custom[key]
+    # walk the nested dicts with an explicit stack rather than recursion
+    stack = [(default, custom)]
+    while stack:
+        parent, child = stack.pop()
+        for key, value in child.items():
+            if isinstance(value, dict) and isinstance(parent.get(key), dict):
+                stack.append((parent[key], value))
+            else:
+                parent[key] = value
 
     return default
 
@@ -44,7 +52,7 @@ def load_config(path, depth=0, max_depth=5):
         raise Exception(f"Maximum inclusion depth {max_depth} exceeded.")
 
     with open(path) as f:
-        d = yaml.safe_load(f)
+        d = yaml.load(f, Loader=_YAML_LOADER)
 
     # get the includes while also removing them from the dict
     includes = d.pop("include", [])
@@ -61,3 +61,34 @@ def support_area_distance(ctrl_object, Q_we):
 
     d = ctrl_object.support_area.distance(c)
     return d
+
+
+def support_area_distances(ctrl_objects, Q_we):
+    """Compute distance outside of SA for each object at current EE orientation Q_we.
+
+    This is equivalent to calling `support_area_distance` for each object, but
+    the EE orientation is only converted once and the intersection points are
+    solved for all objects together.
+    """
+    n = len(ctrl_objects)
+    if n == 0:
+        return np.zeros(0)
+
+    C_we = math.quat_to_rot(Q_we)
+    normals = np.array([obj.support_area.normal() for obj in ctrl_objects])
+    heights = np.array([obj.com_height for obj in ctrl_objects])
+
+    # CoM positions relative to centers of the SAs (one per row)
+    r_com_ws = (heights[:, None] * normals) @ C_we.T
+
+    # same linear systems as in `support_area_distance`, stacked
+    A = np.empty((n, 3, 3))
+    A[:, :2, :] = C_we[:2, :]
+    A[:, 2, :] = normals
+    b = np.zeros((n, 3))
+    b[:, :2] = r_com_ws[:, :2]
+    cs = np.linalg.solve(A, b[..., None])[..., 0]
+
+    return np.array(
+        [obj.support_area.distance(c) for obj, c in zip(ctrl_objects, cs)]
+    )
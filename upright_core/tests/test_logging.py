@@ -0,0 +1,114 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+import upright_core as core
+
+
+def make_logger(**kwargs):
+    config = {"logging": {"log_dir": "/tmp", "timestep": 0.1}}
+    return core.logging.DataLogger(config, **kwargs)
+
+
+def test_append():
+    logger = make_logger(capacity=2)
+    xs = np.arange(15, dtype=float).reshape((5, 3))
+    for x in xs:
+        logger.append("xs", x)
+
+    # buffer has grown beyond the initial capacity, but only the appended
+    # values are returned
+    assert np.array_equal(logger.data["xs"], xs)
+
+    # values are copied into the log
+    x = np.zeros(3)
+    logger.append("xs", x)
+    x[0] = 1
+    assert np.array_equal(logger.data["xs"][-1], np.zeros(3))
+
+
+def test_capacity_from_duration():
+    # one sample per logging timestep, including both endpoints
+    logger = make_logger(duration=1.0)
+    assert logger.capacity == 11
+
+
+def test_append_zero_capacity():
+    logger = make_logger(capacity=0)
+    assert logger.data == {}
+    for i in range(3):
+        logger.append("ts", 0.1 * i)
+    assert np.allclose(logger.data["ts"], [0, 0.1, 0.2])
+
+
+def test_append_upcast():
+    logger = make_logger()
+
+    # ints followed by a float are stored as floats
+    logger.append("a", 1)
+    logger.append("a", 2)
+    logger.append("a", 2.5)
+    assert logger.data["a"].dtype == float
+    assert np.array_equal(logger.data["a"], [1, 2, 2.5])
+
+    # longer strings are not truncated
+    logger.append("s", "ab")
+    logger.append("s", "abcdef")
+    assert list(logger.data["s"]) == ["ab", "abcdef"]
+
+
+def test_append_shape_mismatch():
+    logger = make_logger()
+    logger.append("xs", np.zeros(3))
+    with pytest.raises(ValueError):
+        logger.append("xs", np.zeros(4))
+    assert logger.data["xs"].shape == (1, 3)
+
+
+def test_add():
+    logger = make_logger()
+    logger.add("x", 1)
+    logger.append("ys", 2)
+    data = logger.data
+    assert data["x"] == 1
+    assert np.array_equal(data["ys"], [2])
+
+    # keys cannot be reused between add and append
+    with pytest.raises(ValueError):
+        logger.add("x", 2)
+    with pytest.raises(ValueError):
+        logger.append("x", 2)
+    with pytest.raises(ValueError):
+        logger.add("ys", 2)
+
+
+def test_plot_object_error_quat_sign():
+    # object rotated a small amount relative to a fixed EE, with the object
+    # quaternion returned with alternating signs
+    n = 4
+    angle = 0.002
+    Q_wo = np.array([0, 0, np.sin(angle / 2), np.cos(angle / 2)])
+    Q_wos = np.tile([0, 0, 0, 1.0], (n, 1))
+    Q_wos[1:, :] = Q_wo
+    Q_wos[2, :] *= -1
+
+    data = {
+        "ts": np.arange(n, dtype=float),
+        "r_ow_ws": np.zeros((n, 1, 3)),
+        "r_ew_ws": np.zeros((n, 3)),
+        "Q_wos": Q_wos[:, None, :],
+        "Q_wes": np.tile([0, 0, 0, 1.0], (n, 1)),
+        "object_names": ["box"],
+    }
+    plotter = core.logging.DataPlotter(data)
+    plotter.plot_object_error(0)
+
+    # last line plotted is the error angle
+    lines = plt.gca().get_lines()
+    assert np.allclose(lines[-1].get_ydata(), [0, angle, angle, angle])
+    Q_z = lines[-2].get_ydata()
+    assert np.allclose(Q_z, [0, Q_wo[2], Q_wo[2], Q_wo[2]])
+    plt.close("all")
@@ -11,6 +11,12 @@ def test_skew3():
     V_expected = np.array([[0, -3, 2], [3, 0, -1], [-2, 1, 0]])
     assert np.allclose(V_actual, V_expected)
 
+    # write into an existing array
+    out = np.ones((3, 3))
+    V_out = core.math.skew3(v, out=out)
+    assert V_out is out
+    assert np.allclose(out, V_expected)
+
 
 def test_quat_rot_identity():
     """Test conversions between identity rotation matrices and quaternions."""
@@ -33,6 +39,19 @@ def test_quat_rot_arbitrary():
     assert np.allclose(q, q2)
 
 
+def test_quat_rot_batch():
+    """Test conversion of multiple quaternions to rotation matrices at once."""
+    qs = np.array([[0, 0, 0, 1], [1, 2, 3, 4], [-4, 1, 2, -3]])
+    qs = qs / np.linalg.norm(qs, axis=1)[:, None]
+
+    Cs = core.math.quat_to_rot(qs)
+
+    assert Cs.shape == (3, 3, 3)
+    for q, C in zip(qs, Cs):
+        assert np.allclose(core.math.quat_to_rot(q), C)
+        assert np.allclose(core.math.quat_to_rot(core.math.rot_to_quat(C)), C)
+
+
 def test_quat_angle():
     """Test computation of angle from a quaternion."""
     # no rotation
@@ -44,6 +63,50 @@ def test_quat_angle():
     assert np.isclose(core.math.quat_angle(q1), 0.5 * np.pi)
 
 
+def test_quat_multiply():
+    """Test multiplication of quaternions."""
+    q0 = np.array([1, 2, 3, 4])
+    q0 = q0 / np.linalg.norm(q0)
+    q1 = np.array([-4, 1, 2, -3])
+    q1 = q1 / np.linalg.norm(q1)
+
+    C0 = core.math.quat_to_rot(q0)
+    C1 = core.math.quat_to_rot(q1)
+
+    # q and -q represent the same rotation, so compare rotation matrices
+    q = core.math.quat_multiply(q0, q1)
+    assert np.allclose(core.math.quat_to_rot(q), C0 @ C1)
+
+    # multiplying by the inverse gives the identity
+    q_inv = core.math.quat_inverse(q0)
+    assert np.allclose(core.math.quat_multiply(q0, q_inv), [0, 0, 0, 1])
+
+
+def test_quat_normalize():
+    """Test normalization of one or more quaternions."""
+    q = np.array([1, 2, 3, 4])
+    assert np.allclose(core.math.quat_normalize(q), q / np.linalg.norm(q))
+
+    qs = np.array([[0, 0, 0, 2], [1, 2, 3, 4]])
+    qs_unit = core.math.quat_normalize(qs)
+    assert np.allclose(np.linalg.norm(qs_unit, axis=1), 1)
+    assert np.allclose(qs_unit[0, :], [0, 0, 0, 1])
+
+    with pytest.raises(ValueError):
+        core.math.quat_normalize([[0, 0, 0, 1], [0, 0, 0, 0]])
+
+
+def test_quat_multiply_batch():
+    """Test multiplying arrays of quaternions."""
+    q0 = np.array([1, 2, 3, 4])
+    qs = np.array([[0, 0, 0, 1], [1, 2, 3, 4], [-4, 1, 2, -3]])
+
+    Qs = core.math.quat_multiply(q0, qs)
+    assert Qs.shape == (3, 4)
+    for q, Q in zip(qs, Qs):
+        assert np.allclose(core.math.quat_multiply(q0, q), Q)
+
+
 def test_quat_rotate():
     """Test rotating a point by a quaternion."""
     q = np.array([1, 2, 3, 4])
@@ -67,6 +130,19 @@ def test_quat_transform():
     assert np.allclose(core.math.quat_transform(r, q, v), C @ v + r)
 
 
+def test_quat_transform_batch():
+    """Test rotating and translating multiple points at once."""
+    q = np.array([1, 2, 3, 4])
+    q = q / np.linalg.norm(q)
+    C = core.math.quat_to_rot(q)
+    r = np.array([-1, -2, -3])
+
+    vs = np.array([[1, 2, 3], [0, 0, 1], [-2, 0.5, 4]])
+
+    assert np.allclose(core.math.quat_rotate(q, vs), vs @ C.T)
+    assert np.allclose(core.math.quat_transform(r, q, vs), vs @ C.T + r)
+
+
 def test_inset_vertex():
     """Test insetting a vertex toward the origin."""
     v = np.array([1, 1])
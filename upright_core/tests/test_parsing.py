@@ -20,6 +20,22 @@ def get_points_by_name(names, contacts):
     return {name: np.array(points[name]) for name in names}
 
 
+def test_recursive_dict_update():
+    default = {"a": 1, "b": {"c": 2, "d": {"e": 3}}, "f": {"g": 4}}
+    custom = {"b": {"d": {"e": 5, "h": 6}}, "f": 7, "i": {"j": 8}}
+
+    d = core.parsing.recursive_dict_update(default, custom)
+    assert d == {
+        "a": 1,
+        "b": {"c": 2, "d": {"e": 5, "h": 6}},
+        "f": 7,
+        "i": {"j": 8},
+    }
+
+    with pytest.raises(TypeError):
+        core.parsing.recursive_dict_update(default, [1, 2])
+
+
 def test_parse_number():
     x = "1e-2"
     y = core.parsing.parse_number(x)
@@ -67,22 +67,13 @@ def parse_object_error(
     t0 = ts[0]
     ts -= t0
 
-    n = len(ts)
-    r_ot_ts = []
-    for i in range(n):
-        r_tw_w, Q_wt = tray_poses[i, :3], tray_poses[i, 3:]
-        r_ow_w = r_ow_ws[i, :]
-
-        # tray rotation w.r.t. world
-        C_wt = core.math.quat_to_rot(Q_wt)
-        C_tw = C_wt.T
-
-        # compute offset of object in tray's frame
-        r_ot_w = r_ow_w - r_tw_w
-        r_ot_t = C_tw @ r_ot_w
-        r_ot_ts.append(r_ot_t)
-
-    r_ot_ts = np.array(r_ot_ts)
+    # tray rotations w.r.t. world, for all samples at once
+    r_tw_ws, Q_wts = tray_poses[:, :3], tray_poses[:, 3:]
+    C_wts = core.math.quat_to_rot(Q_wts)
+
+    # compute offset of object in tray's frame: r_ot_t = C_wt.T @ r_ot_w
+    r_ot_ws = r_ow_ws - r_tw_ws
+    r_ot_ts = np.einsum("nji,nj->ni", C_wts, r_ot_ws)
 
     # compute distance w.r.t. the initial position: this is like computing
     # r_{o_i}{o_0}_t, the difference between the ith and 0th positions
@@ -1,4 +1,5 @@
 import os
+import math
 
 import numpy as np
 import pybullet as pyb
@@ -9,7 +10,28 @@ from mobile_manipulation_central.simulation import BulletSimulatedRobot
 import IPython
 
 
+def _rotate_base_velocity(yaw, v, inverse=False):
+    """Rotate the base velocity v[:3] about the z-axis by angle yaw.
+
+    If `inverse=True`, rotate by -yaw instead. Returns a rotated copy of v.
+    Since the rotation is about z, only the planar components v[:2] change,
+    so this is done with scalar trig rather than building a rotation matrix:
+    it is called every control step.
+    """
+    c = math.cos(yaw)
+    s = -math.sin(yaw) if inverse else math.sin(yaw)
+    vx, vy = v[0], v[1]
+    v_rot = np.copy(v)
+    v_rot[0] = c * vx - s * vy
+    v_rot[1] = s * vx + c * vy
+    return v_rot
+
+
 class FixedBaseMapping:
+    @staticmethod
+    def depends_on_yaw(bodyframe=False):
+        return False
+
     @staticmethod
     def forward(q, v, bodyframe=False):
         return q.copy(), v.copy()
@@ -20,33 +42,34 @@ class FixedBaseMapping:
 
 
 class NonholonomicBaseMapping:
+    @staticmethod
+    def depends_on_yaw(bodyframe=False):
+        return True
+
     @staticmethod
     def forward(q, v, bodyframe=False):
         yaw = q[2]
-        C_wb = core.math.rotz(yaw)
-        v_pyb = np.copy(v)
-        v_pyb[1] = 0  # nonholonomic constraint: cannot move sideways
-        v_pyb[:3] = C_wb @ v[:3]
+        v_pyb = _rotate_base_velocity(yaw, v)
         return q.copy(), v_pyb
 
     @staticmethod
     def inverse(q_pyb, v_pyb, bodyframe=False):
         yaw = q_pyb[2]
-        C_wb = core.math.rotz(yaw)
-        v = np.copy(v_pyb)
-        v[:3] = C_wb.T @ v_pyb[:3]
-        v[1] = 0
+        v = _rotate_base_velocity(yaw, v_pyb, inverse=True)
+        v[1] = 0  # nonholonomic constraint: cannot move sideways
         return q_pyb.copy(), v
 
 
 class OmnidirectionalBaseMapping:
+    @staticmethod
+    def depends_on_yaw(bodyframe=False):
+        return bodyframe
+
     @staticmethod
     def forward(q, v, bodyframe=False):
         if bodyframe:
             yaw = q[2]
-            C_wb = core.math.rotz(yaw)
-            v_pyb = np.copy(v)
-            v_pyb[:3] = C_wb @ v[:3]
+            v_pyb = _rotate_base_velocity(yaw, v)
             return q.copy(), v_pyb
         else:
             return q.copy(), v.copy()
@@ -55,18 +78,25 @@ class OmnidirectionalBaseMapping:
     def inverse(q_pyb, v_pyb, bodyframe=False):
         if bodyframe:
             yaw = q_pyb[2]
-            C_wb = core.math.rotz(yaw)
-            v = np.copy(v_pyb)
-            v[:3] = C_wb.T @ v_pyb[:3]
+            v = _rotate_base_velocity(yaw, v_pyb, inverse=True)
             return q_pyb.copy(), v
         else:
             return q_pyb.copy(), v_pyb.copy()
 
 
+# map from base type name to the corresponding input mapping
+_BASE_MAPPINGS = {
+    "fixed": FixedBaseMapping,
+    "nonholonomic": NonholonomicBaseMapping,
+    "omnidirectional": OmnidirectionalBaseMapping,
+}
+
+
 class PyBulletInputMapping:
     """Mappings between our coordinates and PyBullet coordinates.
 
-    Each class provides two functions:
+    Each class provides three functions:
+        depends_on_yaw(bodyframe) -> whether the velocity mapping needs q
         forward(q, v) -> (q_pyb, v_pyb)
         inverse(q_pyb, v_pyb) -> (q, v)
     """
@@ -74,15 +104,11 @@ class PyBulletInputMapping:
     @staticmethod
     def from_string(s):
         s = s.lower()
-        if s == "fixed":
-            return FixedBaseMapping
-        elif s == "nonholonomic":
-            return PyBulletInputMapping.nonholonomic
-        elif s == "omnidirectional":
-            return OmnidirectionalBaseMapping
-        elif s == "floating":
+        if s == "floating":
             raise NotImplementedError("Floating base not yet implemented.")
-        else:
+        try:
+            return _BASE_MAPPINGS[s]
+        except KeyError:
             raise ValueError(f"Cannot create base type from string {s}.")
 
 
@@ -108,6 +134,9 @@ class UprightSimulatedRobot(BulletSimulatedRobot):
         # home position
         self.home = core.parsing.parse_array(config["robot"]["home"])
 
+        # indices of the arm joints, which follow the three base joints
+        self.arm_joint_indices = tuple(self.robot_joint_indices[3:])
+
         # map from (q, v) to PyBullet input
         self.pyb_mapping = PyBulletInputMapping.from_string(
             config["robot"]["base_type"]
@@ -124,26 +153,70 @@ class UprightSimulatedRobot(BulletSimulatedRobot):
         self.v_meas_std_dev = config["robot"]["noise"]["measurement"]["v_std_dev"]
         self.v_cmd_std_dev = config["robot"]["noise"]["process"]["v_std_dev"]
 
+        # noise is drawn from a per-robot generator into preallocated buffers,
+        # since this happens every control step
+        self._rng = np.random.default_rng()
+        self._q_meas_noise = np.empty(self.nq)
+        self._v_meas_noise = np.empty(self.nv)
+        self._v_cmd_noise = np.empty(self.nv)
+
         # set tool to have friction coefficient μ=1 for convenience
         pyb.changeDynamics(self.uid, self.tool_idx, lateralFriction=1.0)
 
     def reset_arm_joints(self, qa):
         """Reset the configuration of the arm only."""
-        for idx, angle in zip(self.robot_joint_indices[3:], qa):
-            pyb.resetJointState(self.uid, idx, angle)
+        # reset all arm joints (with zero velocity) in a single call
+        n = len(self.arm_joint_indices)
+        pyb.resetJointStatesMultiDof(
+            self.uid,
+            self.arm_joint_indices,
+            targetValues=[[angle] for angle in qa],
+            targetVelocities=[[0.0]] * n,
+        )
+
+    def link_pose_and_velocity(self, link_idx=None):
+        """Get the pose and velocity of a link with a single PyBullet query.
+
+        This is equivalent to calling `link_pose` followed by `link_velocity`.
+        Defaults to the tool link.
+
+        Returns a tuple (r, Q, v, ω) of the position, orientation quaternion,
+        linear velocity, and angular velocity in the world frame.
+        """
+        if link_idx is None:
+            link_idx = self.tool_idx
+        state = pyb.getLinkState(
+            self.uid,
+            link_idx,
+            computeLinkVelocity=True,
+            computeForwardKinematics=True,
+        )
+        return (
+            np.array(state[4]),
+            np.array(state[5]),
+            np.array(state[6]),
+            np.array(state[7]),
+        )
 
     def command_velocity(self, cmd_vel, bodyframe=False):
         """Command the velocity of the robot's joints."""
         # self.cmd_vel = cmd_vel
-        q, _ = self.joint_states()
-
         # convert to PyBullet coordinates
-        _, v_pyb = self.pyb_mapping.forward(q, cmd_vel, bodyframe=bodyframe)
+        # the velocity mapping only depends on the configuration through the
+        # base yaw angle, so we only query the joint states if the mapping
+        # actually needs it; otherwise the mapping is the identity
+        if self.pyb_mapping.depends_on_yaw(bodyframe):
+            # positions are the same in our and PyBullet's coordinates, so we
+            # can skip the (copying) inverse mapping done by self.joint_states()
+            q, _ = super().joint_states()
+            _, v_pyb = self.pyb_mapping.forward(q, cmd_vel, bodyframe=bodyframe)
+        else:
+            v_pyb = cmd_vel
 
         # add process noise
-        v_pyb_noisy = v_pyb + np.random.normal(
-            scale=self.v_cmd_std_dev, size=v_pyb.shape
-        )
+        self._rng.standard_normal(out=self._v_cmd_noise)
+        self._v_cmd_noise *= self.v_cmd_std_dev
+        v_pyb_noisy = v_pyb + self._v_cmd_noise
 
         super().command_velocity(v_pyb_noisy)
 
@@ -162,6 +235,10 @@ class UprightSimulatedRobot(BulletSimulatedRobot):
         q, v = self.pyb_mapping.inverse(q_pyb, v_pyb, bodyframe=bodyframe)
 
         if add_noise:
-            q += np.random.normal(scale=self.q_meas_std_dev, size=q.shape)
-            v += np.random.normal(scale=self.v_meas_std_dev, size=v.shape)
+            self._rng.standard_normal(out=self._q_meas_noise)
+            self._rng.standard_normal(out=self._v_meas_noise)
+            self._q_meas_noise *= self.q_meas_std_dev
+            self._v_meas_noise *= self.v_meas_std_dev
+            q += self._q_meas_noise
+            v += self._v_meas_noise
         return q, v
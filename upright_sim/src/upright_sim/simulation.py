@@ -319,6 +319,9 @@ class BulletDynamicObstacle:
         self.start_time = None
         self._mode_idx = 0
 
+        # simulation time at which to switch to the next mode
+        self._next_mode_time = np.inf
+
         self.times = times
         self.positions = positions
         self.velocities = velocities
@@ -374,9 +377,16 @@ class BulletDynamicObstacle:
         a = self.accelerations[self._mode_idx]
         return t, r, v, a
 
+    def _update_next_mode_time(self):
+        if self._mode_idx < len(self.times) - 1:
+            self._next_mode_time = self.start_time + self.times[self._mode_idx + 1]
+        else:
+            self._next_mode_time = np.inf
+
     def start(self, t0):
         """Add the obstacle to the simulation."""
         self.start_time = t0
+        self._update_next_mode_time()
         self.body.add_to_sim()
 
         if not self.collides:
@@ -415,23 +425,24 @@ class BulletDynamicObstacle:
             return reset
 
         # reset the obstacle if we've stepped into a new mode
-        if self._mode_idx < len(self.times) - 1:
-            if t - self.start_time >= self.times[self._mode_idx + 1]:
-                self._mode_idx += 1
-                _, r0, v0, _ = self._initial_mode_values()
-                pyb.resetBasePositionAndOrientation(
-                    self.body.uid, list(r0), [0, 0, 0, 1]
-                )
-                pyb.resetBaseVelocity(self.body.uid, linearVelocity=list(v0))
-                reset = True
+        if t >= self._next_mode_time:
+            self._mode_idx += 1
+            self._update_next_mode_time()
+            _, r0, v0, _ = self._initial_mode_values()
+            pyb.resetBasePositionAndOrientation(self.body.uid, list(r0), [0, 0, 0, 1])
+            pyb.resetBaseVelocity(self.body.uid, linearVelocity=list(v0))
+            reset = True
 
         # velocity needs to be reset at each step of the simulation to negate
         # the effects of gravity
         if self.controlled:
             rd, vd = self._desired_state(t)
-            r, _ = self.body.get_pose()
+            r, _ = pyb.getBasePositionAndOrientation(self.body.uid)
             cmd_vel = self.K @ (rd - r) + vd
-            pyb.resetBaseVelocity(self.body.uid, linearVelocity=list(cmd_vel))
+
+            # tolist() converts to Python floats in one C call, whereas list()
+            # produces NumPy scalars that PyBullet then has to unbox one by one
+            pyb.resetBaseVelocity(self.body.uid, linearVelocity=cmd_vel.tolist())
         return reset
 
 
@@ -498,7 +509,8 @@ def balanced_object_setup(r_ew_w, Q_we, config, robot):
         obj = BulletBody.from_config(obj_type_conf, mu=pyb_mu, orientation=Q_wo)
 
         # parse offset from parent (in EE frame)
-        z = C_we @ np.array([0, 0, 1])
+        # EE z-axis in the world frame
+        z = C_we[:, 2]
         d1 = parent.box.distance_from_centroid_to_boundary(z)
         d2 = obj.box.distance_from_centroid_to_boundary(-z)
 
@@ -552,6 +564,9 @@ class UprightSimulation(BulletSimulation):
         self.config = config
         self.duration = config["duration"]
 
+        # optionally trade contact accuracy for speed
+        self._set_physics_engine_parameters(config.get("physics", {}))
+
         # setup robot
         self.robot = UprightSimulatedRobot(config, position=(0, 0, 0))
         self.robot.reset_joint_configuration(self.robot.home)
@@ -576,6 +591,7 @@ class UprightSimulation(BulletSimulation):
 
         # setup balanced objects
         self.objects = balanced_object_setup(r_ew_w, Q_we, config, self.robot)
+        self._object_uids = tuple(obj.uid for obj in self.objects.values())
 
         # mark frame at the initial position
         if config.get("show_debug_frames", False):
@@ -597,16 +613,34 @@ class UprightSimulation(BulletSimulation):
         # used to change color when object goes non-statically stable
         self.static_stable = True
 
+    @staticmethod
+    def _set_physics_engine_parameters(physics_config):
+        """Override PyBullet's default physics engine parameters.
+
+        Only parameters present in the config are changed.
+        """
+        params = {}
+        if "cone_friction" in physics_config:
+            # disabling uses the faster linearized pyramid friction model
+            params["enableConeFriction"] = int(physics_config["cone_friction"])
+        if "solver_iterations" in physics_config:
+            params["numSolverIterations"] = physics_config["solver_iterations"]
+        if len(params) > 0:
+            pyb.setPhysicsEngineParameter(**params)
+
     def object_poses(self):
         """Get the pose (position and orientation) of every balanced object at
         the current instant.
 
         Useful for logging purposes."""
-        n = len(self.objects)
+        # PyBullet has no batch query for multiple bodies, so we use the UIDs
+        # cached at setup and write directly into the output arrays rather
+        # than allocating new arrays for each pose via obj.get_pose()
+        n = len(self._object_uids)
         r_ow_ws = np.zeros((n, 3))
         Q_wos = np.zeros((n, 4))
-        for i, obj in enumerate(self.objects.values()):
-            r_ow_ws[i, :], Q_wos[i, :] = obj.get_pose()
+        for i, uid in enumerate(self._object_uids):
+            r_ow_ws[i, :], Q_wos[i, :] = pyb.getBasePositionAndOrientation(uid)
         return r_ow_ws, Q_wos
 
     def launch_dynamic_obstacles(self, t0=0):
@@ -29,12 +29,12 @@ def wedge_mesh(half_extents):
 
 def draw_curve(waypoints, rgb=(1, 0, 0), dist=0.05, linewidth=1, dashed=False):
     """Draw debug lines along a curve represented by waypoints in PyBullet."""
-    # process waypoints to space them (roughly) evenly
-    visual_points = [waypoints[0, :]]
-    for i in range(1, len(waypoints)):
-        d = np.linalg.norm(waypoints[i, :] - visual_points[-1])
-        if d >= dist:
-            visual_points.append(waypoints[i, :])
+    # process waypoints to space them (roughly) evenly: take the first
+    # waypoint at or past each multiple of dist along the curve's arc length
+    segment_lengths = np.linalg.norm(np.diff(waypoints, axis=0), axis=1)
+    arc_lengths = np.concatenate(([0], np.cumsum(segment_lengths)))
+    idx = np.searchsorted(arc_lengths, np.arange(0, arc_lengths[-1], dist))
+    visual_points = waypoints[np.unique(idx), :]
 
     step = 2 if dashed else 1
     for i in range(0, len(visual_points) - 1, step):